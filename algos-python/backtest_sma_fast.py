@@ -0,0 +1,76 @@
+"""
+Vectorized SMA crossover backtest.
+Finds every crossover in one NumPy pass instead of calling Strategy.next per bar,
+then books the resulting fills from the small signal index arrays.
+Orders follow backtest_sma.SmaCross: one unit per signal, filled at the next bar's open.
+Does not import the backtesting library; use backtest_sma.py when the interactive
+plot is needed.
+"""
+
+import numpy as np
+import pandas as pd
+
+from shared.sma_backtest import LONG_WINDOW, SHORT_WINDOW, SMA, fetch_symbol_frame
+
+
+def crossover_indices(fast: np.ndarray, slow: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return bar indices where fast crosses above / below slow, as backtesting.lib.crossover does."""
+    above = (fast[:-1] < slow[:-1]) & (fast[1:] > slow[1:])
+    below = (fast[:-1] > slow[:-1]) & (fast[1:] < slow[1:])
+    return np.flatnonzero(above) + 1, np.flatnonzero(below) + 1
+
+
+def run_fast_backtest(
+    df: pd.DataFrame,
+    n1: int,
+    n2: int,
+    cash: float = 100000,
+    commission: float = 0.002,
+    size: int = 1,
+) -> pd.Series:
+    opens = df["Open"].to_numpy(dtype=np.float64)
+    closes = df["Close"].to_numpy(dtype=np.float64)
+    buys, sells = crossover_indices(SMA(closes, n1), SMA(closes, n2))
+
+    # Orders placed on bar i fill at the open of bar i + 1; a signal on the final bar never fills.
+    fills = np.concatenate((buys, sells)) + 1
+    deltas = np.concatenate((np.full(len(buys), size), np.full(len(sells), -size)))
+    keep = fills < len(df)
+    fills, deltas = fills[keep], deltas[keep]
+
+    position_change = np.zeros(len(df))
+    cash_change = np.zeros(len(df))
+    for bar, delta in zip(fills, deltas):
+        price = opens[bar]
+        position_change[bar] += delta
+        cash_change[bar] -= delta * price + abs(delta) * price * commission
+
+    position = np.cumsum(position_change)
+    equity = cash + np.cumsum(cash_change) + position * closes
+    drawdown = equity / np.maximum.accumulate(equity) - 1
+
+    return pd.Series(
+        {
+            "Start": df.index[0],
+            "End": df.index[-1],
+            "Duration": df.index[-1] - df.index[0],
+            "Equity Final [$]": equity[-1],
+            "Equity Peak [$]": equity.max(),
+            "Return [%]": (equity[-1] / cash - 1) * 100,
+            "Buy & Hold Return [%]": (closes[-1] / closes[0] - 1) * 100,
+            "Max. Drawdown [%]": drawdown.min() * 100,
+            "# Fills": len(fills),
+        }
+    )
+
+
+def main():
+    symbol = "AAPL"
+    df = fetch_symbol_frame(symbol)
+
+    stats = run_fast_backtest(df, SHORT_WINDOW, LONG_WINDOW, cash=100000, commission=0.002)
+    print(stats)
+
+
+if __name__ == "__main__":
+    main()
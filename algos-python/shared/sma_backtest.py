@@ -0,0 +1,88 @@
+"""
+Backtest helpers shared by backtest_sma.py and backtest_sma_fast.py: Alpaca bar
+fetching, the SMA indicator and the default crossover windows.
+Kept free of the backtesting library so the vectorized backtest does not import it,
+and outside the top level of algos-python/ so /api/algos does not list it.
+"""
+
+import os
+import datetime
+import functools
+
+import numpy as np
+import pandas as pd
+from dotenv import load_dotenv
+
+SHORT_WINDOW = 5
+LONG_WINDOW = 15
+
+
+@functools.cache
+def get_data_client():
+    # alpaca is only needed once bars are fetched, so keep it off the import path.
+    from alpaca.data.historical import StockHistoricalDataClient
+
+    load_dotenv()
+    api_key = os.getenv("ALPACA_KEY")
+    api_secret = os.getenv("ALPACA_SECRET")
+    if not api_key or not api_secret:
+        raise RuntimeError("ALPACA_KEY / ALPACA_SECRET must be set for the backtest.")
+    return StockHistoricalDataClient(api_key, api_secret)
+
+
+def fetch_symbol_frames(symbols: list[str], days: int = 365) -> dict[str, pd.DataFrame]:
+    """
+    Fetch daily bars for every symbol in one request, keyed by symbol.
+    Results are cached for the rest of the day, so callers must not mutate the frames.
+    """
+    return dict(_fetch_symbol_frames(tuple(symbols), days, datetime.date.today()))
+
+
+@functools.lru_cache(maxsize=64)
+def _fetch_symbol_frames(
+    symbols: tuple[str, ...], days: int, today: datetime.date
+) -> dict[str, pd.DataFrame]:
+    from alpaca.data.requests import StockBarsRequest
+    from alpaca.data.timeframe import TimeFrame
+
+    request_params = StockBarsRequest(
+        symbol_or_symbols=list(symbols),
+        timeframe=TimeFrame.Day,
+        start=today - datetime.timedelta(days=days),
+        end=today,
+    )
+    bars = get_data_client().get_stock_bars(request_params)
+    df = bars.df
+    if df is None or df.empty:
+        raise RuntimeError(f"No historical data returned for {', '.join(symbols)}.")
+    df = df[["open", "high", "low", "close", "volume"]]
+    df.columns = ["Open", "High", "Low", "Close", "Volume"]
+
+    # Alpaca indexes bars by (symbol, timestamp); split on that level directly.
+    frames = {
+        symbol: sub_df.droplevel("symbol").sort_index()
+        for symbol, sub_df in df.groupby(level="symbol")
+    }
+
+    missing = [symbol for symbol in symbols if symbol not in frames]
+    if missing:
+        raise RuntimeError(f"No historical data returned for {', '.join(missing)}.")
+    return frames
+
+
+def fetch_symbol_frame(symbol: str, days: int = 365) -> pd.DataFrame:
+    return fetch_symbol_frames([symbol], days)[symbol]
+
+
+def SMA(values, n: int) -> np.ndarray:
+    """Simple moving average from a running sum; the first n - 1 entries are NaN."""
+    closes = np.asarray(values, dtype=np.float64)
+    if np.isnan(closes).any():
+        # One NaN would poison the running sum for every later bar; rolling()
+        # only blanks the windows that contain it.
+        return pd.Series(closes).rolling(n).mean().to_numpy()
+    sma = np.full(len(closes), np.nan)
+    if len(closes) >= n:
+        csum = np.cumsum(np.concatenate(([0.0], closes)))
+        sma[n - 1:] = (csum[n:] - csum[:-n]) / n
+    return sma
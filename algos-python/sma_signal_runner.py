@@ -9,45 +9,115 @@ Reads JSON on stdin with keys:
 Prints one of BUY, SELL, or HOLD to stdout.
 """
 
-import json
+import marshal
 import sys
+import zlib
 
-import pandas as pd
+import numpy as np
 
 
-def compute_signal(df: pd.DataFrame, short_n: int, long_n: int) -> str:
-    """Return BUY/SELL/HOLD based on SMA crossover."""
-    if df.empty or len(df) < max(short_n, long_n):
-        return "HOLD"
+SIGNAL_NAMES = {-1: "SELL", 0: "HOLD", 1: "BUY"}
+
+# Means that are equal as decimal prices can differ in their last bits as floats,
+# so SMA gaps within this relative tolerance are compared as ties.
+TIE_RTOL = 1e-12
+
+
+def sma_signal_kernel(closes, short_n, long_n):
+    """Return SELL/HOLD/BUY as -1/0/1 from the last two SMA values of each window."""
+    n = closes.shape[0]
+
+    # Sum each window on its own rather than sliding the previous sum, which
+    # would carry the dropped bar's rounding error into the latest mean.
+    short_prev = 0.0
+    for i in range(n - short_n - 1, n - 1):
+        short_prev += closes[i]
+    short_last = 0.0
+    for i in range(n - short_n, n):
+        short_last += closes[i]
+    long_prev = 0.0
+    for i in range(n - long_n - 1, n - 1):
+        long_prev += closes[i]
+    long_last = 0.0
+    for i in range(n - long_n, n):
+        long_last += closes[i]
+
+    # A NaN close in any window makes its gap NaN, every comparison below false,
+    # and the result HOLD.
+    short_prev /= short_n
+    short_last /= short_n
+    long_prev /= long_n
+    long_last /= long_n
+
+    prev_gap = short_prev - long_prev
+    prev_gap *= abs(prev_gap) > TIE_RTOL * max(abs(short_prev), abs(long_prev))
+    last_gap = short_last - long_last
+    last_gap *= abs(last_gap) > TIE_RTOL * max(abs(short_last), abs(long_last))
+
+    buy = (prev_gap <= 0.0) & (last_gap > 0.0)
+    sell = (prev_gap >= 0.0) & (last_gap < 0.0)
+    return np.int32(buy) - np.int32(sell)
+
+
+def kernel_fingerprint() -> int:
+    """Checksum of sma_signal_kernel's bytecode and tie tolerance, baked into AOT builds."""
+    code = sma_signal_kernel.__code__
+    return zlib.crc32(marshal.dumps((code.co_code, code.co_consts, code.co_names, TIE_RTOL)))
 
-    df = df.copy()
-    df["SMA_SHORT"] = df["close"].rolling(short_n).mean()
-    df["SMA_LONG"] = df["close"].rolling(long_n).mean()
-    df = df.dropna()
-    if len(df) < 2:
+
+try:
+    # Ahead-of-time build produced by tools/compile_sma.py.
+    import sma_kernel
+except ImportError:
+    sma_kernel = None
+
+_built_fingerprint = getattr(sma_kernel, "kernel_fingerprint", None)
+if _built_fingerprint is not None and _built_fingerprint() == kernel_fingerprint():
+    _sma_signal = sma_kernel.sma_signal
+else:
+    # No build, or one compiled from an older kernel. The windows are only a few
+    # dozen bars, so plain Python beats a numba import and JIT per runner process.
+    _sma_signal = sma_signal_kernel
+
+
+def compute_signal(closes: np.ndarray, short_n: int, long_n: int) -> str:
+    """Return BUY/SELL/HOLD based on SMA crossover; HOLD if either window holds a NaN close."""
+    if short_n < 1 or long_n < 1 or len(closes) < max(short_n, long_n) + 1:
         return "HOLD"
 
-    prev = df.iloc[-2]
-    last = df.iloc[-1]
-    if prev["SMA_SHORT"] <= prev["SMA_LONG"] and last["SMA_SHORT"] > last["SMA_LONG"]:
-        return "BUY"
-    if prev["SMA_SHORT"] >= prev["SMA_LONG"] and last["SMA_SHORT"] < last["SMA_LONG"]:
-        return "SELL"
-    return "HOLD"
+    closes = np.asarray(closes, dtype=np.float64)
+    return SIGNAL_NAMES[_sma_signal(closes, short_n, long_n)]
+
+
+def _read_payload(stream) -> tuple[int, int, np.ndarray]:
+    """Stream-parse the payload into (short, long, closes) without building the bar dicts."""
+    # Imported here so a missing dependency still falls into main()'s HOLD safeguard.
+    import ijson
+
+    params = {}
+
+    def closes():
+        # A null or missing close becomes NaN so later bars keep their positions.
+        has_close = False
+        for prefix, event, value in ijson.parse(stream, use_float=True):
+            if prefix == "bars.item.close":
+                has_close = True
+                yield value if event == "number" else np.nan
+            elif prefix == "bars.item" and event == "start_map":
+                has_close = False
+            elif prefix == "bars.item" and event == "end_map" and not has_close:
+                yield np.nan
+            elif prefix in ("short", "long"):
+                params[prefix] = value
+
+    closes_arr = np.fromiter(closes(), dtype=np.float64)
+    return int(params.get("short", 5)), int(params.get("long", 15)), closes_arr
 
 
 def main() -> None:
     try:
-        raw = sys.stdin.read()
-        payload = json.loads(raw)
-        short_n = int(payload.get("short", 5))
-        long_n = int(payload.get("long", 15))
-        bars = payload.get("bars", [])
-        df = pd.DataFrame(bars)
-        if "close" not in df.columns:
-            print("HOLD")
-            return
-        signal = compute_signal(df, short_n, long_n)
+        short_n, long_n, closes = _read_payload(sys.stdin.buffer)
+        signal = compute_signal(closes, short_n, long_n)
         print(signal)
     except Exception as exc:  # safeguard so caller always sees a signal
         print("HOLD")
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compile the SMA crossover kernel into a native `sma_kernel` module.
+The backend container runs this on start; elsewhere run it once per Python install:
+    python3 algos-python/tools/compile_sma.py
+sma_signal_runner.py imports the result when its fingerprint matches the current
+kernel and otherwise runs the kernel as plain Python, so numba is only needed here.
+"""
+
+import sys
+from pathlib import Path
+
+from numba.pycc import CC
+
+# Kept in tools/ because /api/algos lists every top-level algos-python/*.py as an
+# algorithm; the runner it builds for, and the built module, live one level up.
+ALGOS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ALGOS_DIR))
+
+from sma_signal_runner import kernel_fingerprint, sma_signal_kernel  # noqa: E402
+
+KERNEL_FINGERPRINT = kernel_fingerprint()
+
+cc = CC("sma_kernel")
+cc.output_dir = str(ALGOS_DIR)
+cc.export("sma_signal", "i4(f8[:], i4, i4)")(sma_signal_kernel)
+
+
+@cc.export("kernel_fingerprint", "i8()")
+def _kernel_fingerprint():
+    # Lets the runner reject a build made from a different kernel source.
+    return KERNEL_FINGERPRINT
+
+
+if __name__ == "__main__":
+    for stale in Path(cc.output_dir).glob("sma_kernel*.so"):
+        stale.unlink()
+    cc.compile()